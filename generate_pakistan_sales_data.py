@@ -6,13 +6,153 @@ Generates realistic sales data for Pakistani markets in a fully normalized OLTP
 
 import pandas as pd
 import numpy as np
-import random
-from datetime import datetime, timedelta
+from datetime import datetime
 import csv
 import os
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy version below is used instead
+    njit = None
+
+
+def _run_in_worker(generator, method_name, seed_sequence, *args):
+    """Run a generator method in a worker process with its own random stream"""
+    generator.rng = np.random.default_rng(seed_sequence)
+    return getattr(generator, method_name)(*args)
+
+
+def _random_past_dates(rng, today, max_days, n):
+    """Draw n dates between today - max_days and today as datetime64[D]"""
+    return today - rng.integers(0, max_days + 1, n).astype('timedelta64[D]')
+
+
+def _compute_line_amounts(unit_price, quantity, discount_percent):
+    """Compute order line amounts and discounts"""
+    gross_amount = unit_price * quantity
+    line_discount = gross_amount * discount_percent
+    return gross_amount - line_discount, line_discount
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _compute_line_amounts(unit_price, quantity, discount_percent):
+        """Compute order line amounts and discounts in a compiled parallel loop"""
+        n = unit_price.shape[0]
+        line_amount = np.empty(n)
+        line_discount = np.empty(n)
+        for i in prange(n):
+            gross_amount = unit_price[i] * quantity[i]
+            line_discount[i] = gross_amount * discount_percent[i]
+            line_amount[i] = gross_amount - line_discount[i]
+        return line_amount, line_discount
+
+
+def _generate_order_batch(seed_sequence, today, first_order_id, num_orders, customer_ids, customer_names,
+                          staffed_store_ids, store_staff_offsets, store_staff_counts, employee_ids_by_store,
+                          product_ids, product_prices, shipping_methods, payment_methods):
+    """Generate one batch of orders and their line items in a worker process"""
+    rng = np.random.default_rng(seed_sequence)
+    order_ids = np.arange(first_order_id, first_order_id + num_orders)
+    
+    # Generate order details (1-5 distinct products per order) for all orders at once
+    lines_per_order = rng.integers(1, 6, num_orders)
+    line_order_ids = np.repeat(order_ids, lines_per_order)
+    product_idx = rng.integers(0, len(product_ids), len(line_order_ids))
+    distinct_lines = ~pd.DataFrame({'ORDER_ID': line_order_ids, 'PRODUCT': product_idx}).duplicated().to_numpy()
+    line_order_ids = line_order_ids[distinct_lines]
+    product_idx = product_idx[distinct_lines]
+    num_lines = len(line_order_ids)
+    
+    quantity = rng.integers(1, 6, num_lines)
+    unit_price = product_prices[product_idx]
+    
+    # Apply random discount (0-20%)
+    discount_percent = rng.uniform(0, 0.2, num_lines)
+    line_amount, line_discount = _compute_line_amounts(unit_price, quantity, discount_percent)
+    
+    order_details = pd.DataFrame({
+        'ORDER_ID': line_order_ids,
+        'PRODUCT_ID': product_ids[product_idx],
+        'QUANTITY_ORDERED': quantity,
+        'UNIT_PRICE': unit_price,
+        'DISCOUNT_PERCENT': discount_percent * 100,
+        'TOTAL_LINE_AMOUNT': line_amount
+    }).round({'DISCOUNT_PERCENT': 2, 'TOTAL_LINE_AMOUNT': 2})
+    
+    # Aggregate line amounts into order totals
+    order_totals = pd.DataFrame({
+        'ORDER_ID': line_order_ids,
+        'TOTAL_AMOUNT': line_amount,
+        'DISCOUNT_AMOUNT': line_discount
+    }).groupby('ORDER_ID').sum()
+    total_amount = order_totals['TOTAL_AMOUNT'].to_numpy()
+    discount_amount = order_totals['DISCOUNT_AMOUNT'].to_numpy()
+    shipping_cost = rng.integers(0, 501, num_orders)
+    
+    # Calculate tax (15% GST in Pakistan)
+    tax_amount = total_amount * 0.15
+    final_amount = total_amount + tax_amount + shipping_cost - discount_amount
+    
+    # Pick customer, store and an employee working at that store (from the store's slice of the grouped staff)
+    customer_idx = rng.integers(0, len(customer_ids), num_orders)
+    store_idx = rng.integers(0, len(staffed_store_ids), num_orders)
+    order_store_ids = staffed_store_ids[store_idx]
+    order_employee_ids = employee_ids_by_store[store_staff_offsets[store_idx]
+                                               + rng.integers(0, store_staff_counts[store_idx])]
+    
+    # Generate order date within last 2 years
+    order_date = _random_past_dates(rng, today, 730, num_orders)
+    required_date = order_date + rng.integers(1, 15, num_orders).astype('timedelta64[D]')
+    is_shipped = rng.random(num_orders) < 0.8
+    ship_date = np.where(is_shipped, order_date + rng.integers(1, 8, num_orders).astype('timedelta64[D]'),
+                         np.datetime64('NaT'))
+    
+    # Order status based on dates
+    order_status = np.where(
+        ~is_shipped, rng.choice(np.array(['Pending', 'Processing']), num_orders),
+        np.where(ship_date < today, rng.choice(np.array(['Delivered', 'Shipped']), num_orders), 'Shipped')
+    )
+    
+    orders = pd.DataFrame({
+        'ORDER_ID': order_ids,
+        'CUSTOMER_ID': customer_ids[customer_idx],
+        'STORE_ID': order_store_ids,
+        'EMPLOYEE_ID': order_employee_ids,
+        'ORDER_DATE': order_date,
+        'REQUIRED_DATE': required_date,
+        'SHIP_DATE': ship_date,
+        'ORDER_STATUS': order_status,
+        'SHIP_METHOD': rng.choice(shipping_methods, num_orders),
+        'SHIPPING_ADDRESS_ID': None,  # Will be set later
+        'TOTAL_AMOUNT': total_amount,
+        'TAX_AMOUNT': tax_amount,
+        'SHIPPING_COST': shipping_cost,
+        'DISCOUNT_AMOUNT': discount_amount,
+        'FINAL_AMOUNT': final_amount,
+        'PAYMENT_METHOD': rng.choice(payment_methods, num_orders),
+        'PAYMENT_STATUS': np.where(np.isin(order_status, ['Delivered', 'Shipped']), 'Completed', 'Pending'),
+        'NOTES': 'Order placed by ' + pd.Series(customer_names[customer_idx])
+    }).round({'TOTAL_AMOUNT': 2, 'TAX_AMOUNT': 2, 'DISCOUNT_AMOUNT': 2, 'FINAL_AMOUNT': 2})
+    
+    return orders, order_details
+
 
 class PakistanSalesDataGenerator:
-    def __init__(self):
+    def __init__(self, seed=None):
+        # PCG64 generator used for all (vectorized) sampling; worker processes
+        # get independent streams spawned from the same seed sequence
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        
+        # Reference date for all generated dates, fixed once per generator
+        self.today = np.datetime64(datetime.now().date(), 'D')
+        
         # Pakistani provinces and major cities
         self.provinces = {
             'Punjab': ['Lahore', 'Faisalabad', 'Rawalpindi', 'Multan', 'Gujranwala', 'Sialkot', 'Bahawalpur', 'Sargodha'],
@@ -49,6 +189,13 @@ class PakistanSalesDataGenerator:
             8: {'name': 'Books & Stationery', 'brands': ['Oxford', 'Pelikan', 'Dollar', 'Pilot', 'Staedtler']}
         }
         
+        # Item types used to name products in the Electronics, Textiles and Food categories
+        self.product_types = {
+            1: ['Smartphone', 'Laptop', 'Tablet', 'TV', 'Headphones', 'Camera', 'Speaker', 'Charger'],
+            2: ['Shirt', 'Pants', 'Dress', 'Suit', 'Kurta', 'Shalwar', 'Dupatta', 'Scarf'],
+            3: ['Rice', 'Oil', 'Tea', 'Biscuits', 'Chocolate', 'Juice', 'Milk', 'Bread']
+        }
+        
         # Store types and names
         self.store_types = ['Retail', 'Supermarket', 'Department Store', 'Specialty Store', 'Outlet', 'Mall']
         
@@ -72,377 +219,345 @@ class PakistanSalesDataGenerator:
         
         # Genders
         self.genders = ['M', 'F', 'Other']
+        
+        # Lookup tuples reused by the generators instead of being rebuilt per row
+        self._province_names = tuple(self.provinces)
+        self._cities_by_province = {province: tuple(cities) for province, cities in self.provinces.items()}
+        self._category_ids = tuple(self.product_categories)
+        
+        # Low-cardinality string columns cast to categoricals (dictionary encoded) before export
+        self.categorical_columns = [
+            'PROVINCE', 'CITY', 'COUNTRY', 'ADDRESS_TYPE', 'CUSTOMER_SEGMENT', 'GENDER', 'MARITAL_STATUS',
+            'EDUCATION_LEVEL', 'BRAND', 'STORE_TYPE', 'JOB_TITLE', 'DEPARTMENT', 'ORDER_STATUS', 'SHIP_METHOD',
+            'PAYMENT_METHOD', 'PAYMENT_STATUS'
+        ]
+        
+        # Tables exported as Parquet datasets partitioned by ORDER_DATE year and month
+        self.date_partitioned_tables = ['orders', 'sales_data']
 
     def generate_customers(self, num_customers=1000):
         """Generate customer data"""
-        customers = []
-        
-        for i in range(1, num_customers + 1):
-            first_name = random.choice(self.first_names)
-            last_name = random.choice(self.last_names)
-            email = f"{first_name.lower()}.{last_name.lower()}@{random.choice(['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com'])}"
-            phone = f"+92-{random.randint(300, 349)}-{random.randint(1000000, 9999999)}"
-            
-            # Generate realistic birth date (18-80 years old)
-            birth_year = random.randint(1944, 2006)
-            birth_month = random.randint(1, 12)
-            birth_day = random.randint(1, 28)  # Using 28 to avoid month/day issues
-            date_of_birth = datetime(birth_year, birth_month, birth_day).date()
-            
-            # Generate registration date (within last 5 years)
-            registration_date = datetime.now().date() - timedelta(days=random.randint(0, 1825))
-            
-            # Generate annual income based on segment
-            segment = random.choices(self.customer_segments, weights=[0.1, 0.6, 0.25, 0.05])[0]
-            if segment == 'Premium':
-                annual_income = random.randint(1500000, 5000000)  # 1.5M - 5M PKR
-            elif segment == 'VIP':
-                annual_income = random.randint(5000000, 15000000)  # 5M - 15M PKR
-            elif segment == 'Regular':
-                annual_income = random.randint(500000, 1500000)   # 500K - 1.5M PKR
-            else:  # Occasional
-                annual_income = random.randint(200000, 800000)    # 200K - 800K PKR
-            
-            customers.append({
-                'CUSTOMER_ID': i,
-                'FIRST_NAME': first_name,
-                'LAST_NAME': last_name,
-                'EMAIL': email,
-                'PHONE': phone,
-                'DATE_OF_BIRTH': date_of_birth,
-                'GENDER': random.choice(self.genders),
-                'MARITAL_STATUS': random.choice(self.marital_statuses),
-                'EDUCATION_LEVEL': random.choice(self.education_levels),
-                'ANNUAL_INCOME': annual_income,
-                'CUSTOMER_SEGMENT': segment,
-                'REGISTRATION_DATE': registration_date,
-                'IS_ACTIVE': random.choice([True, True, True, False])  # 75% active
-            })
-        
-        return customers
+        rng = self.rng
+        n = num_customers
+        
+        first_names = pd.Series(rng.choice(np.array(self.first_names), n))
+        last_names = pd.Series(rng.choice(np.array(self.last_names), n))
+        domains = rng.choice(np.array(['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']), n)
+        email = self._bulk_emails(first_names, last_names, domains)
+        phone = self._bulk_phones(n)
+        
+        # Generate realistic birth date (18-80 years old), using days 1-28 to avoid month/day issues
+        birth_month = (rng.integers(1944, 2007, n) - 1970).astype('datetime64[Y]').astype('datetime64[M]')
+        birth_month += rng.integers(0, 12, n).astype('timedelta64[M]')
+        date_of_birth = birth_month.astype('datetime64[D]') + rng.integers(0, 28, n).astype('timedelta64[D]')
+        
+        # Generate registration date (within last 5 years)
+        registration_date = _random_past_dates(rng, self.today, 1825, n)
+        
+        # Generate annual income based on segment (Premium, Regular, Occasional, VIP)
+        segment_idx = rng.choice(len(self.customer_segments), n, p=[0.1, 0.6, 0.25, 0.05])
+        income_low = np.array([1500000, 500000, 200000, 5000000])[segment_idx]     # 1.5M, 500K, 200K, 5M PKR
+        income_high = np.array([5000000, 1500000, 800000, 15000000])[segment_idx]  # 5M, 1.5M, 800K, 15M PKR
+        annual_income = rng.integers(income_low, income_high + 1)
+        
+        return pd.DataFrame({
+            'CUSTOMER_ID': np.arange(1, n + 1),
+            'FIRST_NAME': first_names,
+            'LAST_NAME': last_names,
+            'EMAIL': email,
+            'PHONE': phone,
+            'DATE_OF_BIRTH': date_of_birth,
+            'GENDER': rng.choice(np.array(self.genders), n),
+            'MARITAL_STATUS': rng.choice(np.array(self.marital_statuses), n),
+            'EDUCATION_LEVEL': rng.choice(np.array(self.education_levels), n),
+            'ANNUAL_INCOME': annual_income,
+            'CUSTOMER_SEGMENT': np.array(self.customer_segments)[segment_idx],
+            'REGISTRATION_DATE': registration_date,
+            'IS_ACTIVE': rng.random(n) < 0.75  # 75% active
+        })
 
     def generate_customer_addresses(self, customers):
         """Generate customer addresses"""
-        addresses = []
-        address_id = 1
-        
-        for customer in customers:
-            # Each customer gets 1-2 addresses
-            num_addresses = random.choices([1, 2], weights=[0.8, 0.2])[0]
-            
-            for i in range(num_addresses):
-                province = random.choice(list(self.provinces.keys()))
-                city = random.choice(self.provinces[province])
-                
-                # Generate realistic street addresses
-                street_numbers = [f"{random.randint(1, 999)}", f"Block {random.choice(['A', 'B', 'C', 'D', 'E'])}", f"House {random.randint(1, 999)}"]
-                street_names = [
-                    'Main Boulevard', 'Park Road', 'Mall Road', 'College Road', 'University Road',
-                    'Industrial Area', 'Defence Housing', 'Gulberg', 'Model Town', 'Johar Town',
-                    'Bahria Town', 'DHA', 'Clifton', 'Saddar', 'Cantt'
-                ]
-                
-                street_address = f"{random.choice(street_numbers)} {random.choice(street_names)}"
-                postal_code = f"{random.randint(10000, 99999)}"
-                
-                addresses.append({
-                    'ADDRESS_ID': address_id,
-                    'CUSTOMER_ID': customer['CUSTOMER_ID'],
-                    'ADDRESS_TYPE': 'Primary' if i == 0 else 'Secondary',
-                    'STREET_ADDRESS': street_address,
-                    'CITY': city,
-                    'PROVINCE': province,
-                    'POSTAL_CODE': postal_code,
-                    'COUNTRY': 'Pakistan',
-                    'IS_DEFAULT': i == 0
-                })
-                address_id += 1
-        
-        return addresses
+        rng = self.rng
+        
+        # Each customer gets 1-2 addresses
+        addresses_per_customer = rng.choice(np.array([1, 2]), len(customers), p=[0.8, 0.2])
+        customer_ids = np.repeat(customers['CUSTOMER_ID'].to_numpy(), addresses_per_customer)
+        n = len(customer_ids)
+        is_primary = ~pd.Series(customer_ids).duplicated().to_numpy()
+        provinces, cities = self._random_locations(n)
+        
+        # Generate realistic street addresses ("123", "Block A" or "House 123")
+        house_numbers = pd.Series(rng.integers(1, 1000, n)).astype(str)
+        blocks = 'Block ' + pd.Series(rng.choice(np.array(['A', 'B', 'C', 'D', 'E']), n))
+        number_style = rng.integers(0, 3, n)
+        street_numbers = house_numbers.where(number_style == 0, blocks.where(number_style == 1, 'House ' + house_numbers))
+        street_names = np.array([
+            'Main Boulevard', 'Park Road', 'Mall Road', 'College Road', 'University Road',
+            'Industrial Area', 'Defence Housing', 'Gulberg', 'Model Town', 'Johar Town',
+            'Bahria Town', 'DHA', 'Clifton', 'Saddar', 'Cantt'
+        ])
+        
+        return pd.DataFrame({
+            'ADDRESS_ID': np.arange(1, n + 1),
+            'CUSTOMER_ID': customer_ids,
+            'ADDRESS_TYPE': np.where(is_primary, 'Primary', 'Secondary'),
+            'STREET_ADDRESS': street_numbers + ' ' + rng.choice(street_names, n),
+            'CITY': cities,
+            'PROVINCE': provinces,
+            'POSTAL_CODE': pd.Series(rng.integers(10000, 100000, n)).astype(str),
+            'COUNTRY': 'Pakistan',
+            'IS_DEFAULT': is_primary
+        })
 
     def generate_product_categories(self):
         """Generate product categories"""
-        categories = []
-        
-        for cat_id, cat_info in self.product_categories.items():
-            categories.append({
-                'CATEGORY_ID': cat_id,
-                'CATEGORY_NAME': cat_info['name'],
-                'DESCRIPTION': f"Products in {cat_info['name']} category",
-                'PARENT_CATEGORY_ID': None,  # No hierarchy for now
-                'IS_ACTIVE': True
-            })
-        
-        return categories
+        category_names = pd.Series([info['name'] for info in self.product_categories.values()])
+        
+        return pd.DataFrame({
+            'CATEGORY_ID': list(self.product_categories),
+            'CATEGORY_NAME': category_names,
+            'DESCRIPTION': 'Products in ' + category_names + ' category',
+            'PARENT_CATEGORY_ID': None,  # No hierarchy for now
+            'IS_ACTIVE': True
+        })
 
     def generate_products(self, num_products=500):
         """Generate product data"""
-        products = []
-        
-        for i in range(1, num_products + 1):
-            category_id = random.choice(list(self.product_categories.keys()))
-            category_info = self.product_categories[category_id]
-            brand = random.choice(category_info['brands'])
-            
-            # Generate product name based on category and brand
-            if category_id == 1:  # Electronics
-                product_names = ['Smartphone', 'Laptop', 'Tablet', 'TV', 'Headphones', 'Camera', 'Speaker', 'Charger']
-                product_name = f"{brand} {random.choice(product_names)} {random.randint(1, 20)}"
-            elif category_id == 2:  # Textiles
-                product_names = ['Shirt', 'Pants', 'Dress', 'Suit', 'Kurta', 'Shalwar', 'Dupatta', 'Scarf']
-                product_name = f"{brand} {random.choice(product_names)}"
-            elif category_id == 3:  # Food
-                product_names = ['Rice', 'Oil', 'Tea', 'Biscuits', 'Chocolate', 'Juice', 'Milk', 'Bread']
-                product_name = f"{brand} {random.choice(product_names)}"
-            else:
-                product_name = f"{brand} Product {i}"
-            
-            # Generate realistic pricing
-            base_price = random.randint(500, 50000)
-            unit_cost = base_price * random.uniform(0.6, 0.8)
-            unit_price = base_price
-            msrp = base_price * random.uniform(1.1, 1.3)
-            
-            # Generate weight and dimensions for physical products
-            weight_kg = random.uniform(0.1, 10.0) if category_id not in [3, 7, 8] else random.uniform(0.01, 2.0)
-            dimensions = f"{random.randint(10, 100)}x{random.randint(10, 100)}x{random.randint(1, 50)} cm"
-            
-            products.append({
-                'PRODUCT_ID': i,
-                'PRODUCT_NAME': product_name,
-                'CATEGORY_ID': category_id,
-                'BRAND': brand,
-                'MODEL': f"Model-{random.randint(1000, 9999)}",
-                'DESCRIPTION': f"High quality {product_name.lower()} from {brand}",
-                'UNIT_COST': round(unit_cost, 2),
-                'UNIT_PRICE': round(unit_price, 2),
-                'MSRP': round(msrp, 2),
-                'WEIGHT_KG': round(weight_kg, 2),
-                'DIMENSIONS_CM': dimensions,
-                'IS_ACTIVE': random.choice([True, True, True, False])  # 75% active
-            })
-        
-        return products
+        rng = self.rng
+        n = num_products
+        
+        category_idx = rng.integers(0, len(self._category_ids), n)
+        category_ids = np.array(self._category_ids)[category_idx]
+        brands = pd.Series(self._choose_within(
+            category_idx, [self.product_categories[cat_id]['brands'] for cat_id in self._category_ids]))
+        
+        # Generate product name based on category and brand
+        item_types = pd.Series(self._choose_within(
+            category_idx, [self.product_types.get(cat_id, ['']) for cat_id in self._category_ids]))
+        product_names = pd.Series(np.select(
+            [category_ids == 1, np.isin(category_ids, [2, 3])],  # Electronics, Textiles and Food
+            [brands + ' ' + item_types + ' ' + pd.Series(rng.integers(1, 21, n)).astype(str),
+             brands + ' ' + item_types],
+            brands + ' Product ' + pd.Series(np.arange(1, n + 1)).astype(str)
+        ))
+        
+        # Generate realistic pricing
+        base_price = rng.integers(500, 50001, n)
+        unit_cost = base_price * rng.uniform(0.6, 0.8, n)
+        msrp = base_price * rng.uniform(1.1, 1.3, n)
+        
+        # Generate weight and dimensions for physical products
+        weight_kg = np.where(np.isin(category_ids, [3, 7, 8]), rng.uniform(0.01, 2.0, n), rng.uniform(0.1, 10.0, n))
+        dimensions = (pd.Series(rng.integers(10, 101, n)).astype(str)
+                      + 'x' + pd.Series(rng.integers(10, 101, n)).astype(str)
+                      + 'x' + pd.Series(rng.integers(1, 51, n)).astype(str) + ' cm')
+        
+        return pd.DataFrame({
+            'PRODUCT_ID': np.arange(1, n + 1),
+            'PRODUCT_NAME': product_names,
+            'CATEGORY_ID': category_ids,
+            'BRAND': brands,
+            'MODEL': 'Model-' + pd.Series(rng.integers(1000, 10000, n)).astype(str),
+            'DESCRIPTION': 'High quality ' + product_names.str.lower() + ' from ' + brands,
+            'UNIT_COST': unit_cost,
+            'UNIT_PRICE': base_price,
+            'MSRP': msrp,
+            'WEIGHT_KG': weight_kg,
+            'DIMENSIONS_CM': dimensions,
+            'IS_ACTIVE': rng.random(n) < 0.75  # 75% active
+        }).round({'UNIT_COST': 2, 'MSRP': 2, 'WEIGHT_KG': 2})
 
     def generate_stores(self, num_stores=50):
         """Generate store data"""
-        stores = []
-        
-        for i in range(1, num_stores + 1):
-            province = random.choice(list(self.provinces.keys()))
-            city = random.choice(self.provinces[province])
-            
-            store_name = f"{random.choice(['Mega', 'Super', 'Prime', 'Elite', 'Premium', 'Express'])} {random.choice(['Store', 'Mart', 'Center', 'Plaza', 'Mall'])} {i}"
-            store_code = f"ST{i:03d}"
-            
-            # Generate store address
-            street_address = f"{random.randint(1, 999)} {random.choice(['Main Road', 'Commercial Area', 'Market Street', 'Shopping District'])}"
-            phone = f"+92-{random.randint(300, 349)}-{random.randint(1000000, 9999999)}"
-            email = f"info@{store_name.lower().replace(' ', '')}.com"
-            
-            # Opening date within last 10 years
-            opening_date = datetime.now().date() - timedelta(days=random.randint(0, 3650))
-            
-            stores.append({
-                'STORE_ID': i,
-                'STORE_NAME': store_name,
-                'STORE_CODE': store_code,
-                'ADDRESS': street_address,
-                'CITY': city,
-                'PROVINCE': province,
-                'POSTAL_CODE': f"{random.randint(10000, 99999)}",
-                'PHONE': phone,
-                'EMAIL': email,
-                'MANAGER_ID': None,  # Will be set later
-                'STORE_TYPE': random.choice(self.store_types),
-                'IS_ACTIVE': random.choice([True, True, True, False]),  # 75% active
-                'OPENING_DATE': opening_date
-            })
-        
-        return stores
+        rng = self.rng
+        n = num_stores
+        store_ids = np.arange(1, n + 1)
+        provinces, cities = self._random_locations(n)
+        
+        # Build name, email and phone columns with vectorized string ops
+        store_names = (pd.Series(rng.choice(np.array(['Mega', 'Super', 'Prime', 'Elite', 'Premium', 'Express']), n))
+                       + ' ' + pd.Series(rng.choice(np.array(['Store', 'Mart', 'Center', 'Plaza', 'Mall']), n))
+                       + ' ' + pd.Series(store_ids).astype(str))
+        emails = 'info@' + store_names.str.lower().str.replace(' ', '') + '.com'
+        phones = self._bulk_phones(n)
+        
+        # Generate store address
+        street_addresses = (pd.Series(rng.integers(1, 1000, n)).astype(str) + ' '
+                            + rng.choice(np.array(['Main Road', 'Commercial Area', 'Market Street', 'Shopping District']), n))
+        
+        # Opening date within last 10 years
+        opening_date = _random_past_dates(rng, self.today, 3650, n)
+        
+        return pd.DataFrame({
+            'STORE_ID': store_ids,
+            'STORE_NAME': store_names,
+            'STORE_CODE': 'ST' + pd.Series(store_ids).astype(str).str.zfill(3),
+            'ADDRESS': street_addresses,
+            'CITY': cities,
+            'PROVINCE': provinces,
+            'POSTAL_CODE': pd.Series(rng.integers(10000, 100000, n)).astype(str),
+            'PHONE': phones,
+            'EMAIL': emails,
+            'MANAGER_ID': pd.array([None] * n, dtype='Int64'),  # Will be set later
+            'STORE_TYPE': rng.choice(np.array(self.store_types), n),
+            'IS_ACTIVE': rng.random(n) < 0.75,  # 75% active
+            'OPENING_DATE': opening_date
+        })
 
     def generate_employees(self, stores, num_employees=200):
         """Generate employee data"""
-        employees = []
-        
-        for i in range(1, num_employees + 1):
-            first_name = random.choice(self.first_names)
-            last_name = random.choice(self.last_names)
-            email = f"{first_name.lower()}.{last_name.lower()}@company.com"
-            phone = f"+92-{random.randint(300, 349)}-{random.randint(1000000, 9999999)}"
-            
-            # Hire date within last 5 years
-            hire_date = datetime.now().date() - timedelta(days=random.randint(0, 1825))
-            
-            # Job titles and departments
-            job_titles = ['Sales Associate', 'Cashier', 'Manager', 'Supervisor', 'Customer Service', 'Stock Clerk']
-            departments = ['Sales', 'Customer Service', 'Operations', 'Management', 'Inventory']
-            
-            job_title = random.choice(job_titles)
-            department = random.choice(departments)
-            
-            # Assign to a random store
-            store_id = random.choice(stores)['STORE_ID']
-            
-            # Generate salary based on job title
-            if 'Manager' in job_title:
-                salary = random.randint(80000, 150000)  # 80K - 150K PKR
-            elif 'Supervisor' in job_title:
-                salary = random.randint(60000, 100000)  # 60K - 100K PKR
-            else:
-                salary = random.randint(30000, 60000)   # 30K - 60K PKR
-            
-            employees.append({
-                'EMPLOYEE_ID': i,
-                'FIRST_NAME': first_name,
-                'LAST_NAME': last_name,
-                'EMAIL': email,
-                'PHONE': phone,
-                'HIRE_DATE': hire_date,
-                'JOB_TITLE': job_title,
-                'DEPARTMENT': department,
-                'STORE_ID': store_id,
-                'MANAGER_ID': None,  # Will be set later
-                'SALARY': salary,
-                'IS_ACTIVE': random.choice([True, True, True, False])  # 75% active
-            })
-        
-        # Assign managers
-        managers = [e for e in employees if 'Manager' in e['JOB_TITLE']]
-        non_managers = [e for e in employees if 'Manager' not in e['JOB_TITLE']]
-        
-        for emp in non_managers:
-            if random.random() < 0.3:  # 30% have managers
-                emp['MANAGER_ID'] = random.choice(managers)['EMPLOYEE_ID']
-        
-        # Update store manager IDs
-        for store in stores:
-            store_employees = [e for e in employees if e['STORE_ID'] == store['STORE_ID'] and 'Manager' in e['JOB_TITLE']]
-            if store_employees:
-                store['MANAGER_ID'] = random.choice(store_employees)['EMPLOYEE_ID']
+        rng = self.rng
+        n = num_employees
+        employee_ids = np.arange(1, n + 1)
+        
+        # Build name, email and phone columns with vectorized string ops
+        first_names = pd.Series(rng.choice(np.array(self.first_names), n))
+        last_names = pd.Series(rng.choice(np.array(self.last_names), n))
+        emails = self._bulk_emails(first_names, last_names, 'company.com')
+        phones = self._bulk_phones(n)
+        
+        # Hire date within last 5 years
+        hire_date = _random_past_dates(rng, self.today, 1825, n)
+        
+        # Job titles and departments
+        job_titles = rng.choice(np.array(['Sales Associate', 'Cashier', 'Manager', 'Supervisor', 'Customer Service',
+                                          'Stock Clerk']), n)
+        departments = rng.choice(np.array(['Sales', 'Customer Service', 'Operations', 'Management', 'Inventory']), n)
+        is_manager = job_titles == 'Manager'
+        
+        # Assign to a random store
+        store_ids = rng.choice(stores['STORE_ID'].to_numpy(), n)
+        
+        # Generate salary based on job title (Manager 80K-150K, Supervisor 60K-100K, others 30K-60K PKR)
+        is_supervisor = job_titles == 'Supervisor'
+        salary_low = np.select([is_manager, is_supervisor], [80000, 60000], 30000)
+        salary_high = np.select([is_manager, is_supervisor], [150000, 100000], 60000)
+        salary = rng.integers(salary_low, salary_high + 1)
+        
+        # Assign managers (30% of non-managers have one)
+        manager_ids = pd.array([None] * n, dtype='Int64')
+        has_manager = ~is_manager & (rng.random(n) < 0.3)
+        if is_manager.any():
+            manager_ids[has_manager] = rng.choice(employee_ids[is_manager], has_manager.sum())
+        
+        employees = pd.DataFrame({
+            'EMPLOYEE_ID': employee_ids,
+            'FIRST_NAME': first_names,
+            'LAST_NAME': last_names,
+            'EMAIL': emails,
+            'PHONE': phones,
+            'HIRE_DATE': hire_date,
+            'JOB_TITLE': job_titles,
+            'DEPARTMENT': departments,
+            'STORE_ID': store_ids,
+            'MANAGER_ID': manager_ids,
+            'SALARY': salary,
+            'IS_ACTIVE': rng.random(n) < 0.75  # 75% active
+        })
+        
+        # Update store manager IDs with one random manager from each store
+        store_managers = (
+            pd.DataFrame({'STORE_ID': store_ids[is_manager], 'EMPLOYEE_ID': employee_ids[is_manager]})
+            .sample(frac=1, random_state=rng)
+            .drop_duplicates('STORE_ID')
+            .set_index('STORE_ID')['EMPLOYEE_ID']
+        )
+        stores['MANAGER_ID'] = stores['STORE_ID'].map(store_managers).astype('Int64')
         
         return employees
 
-    def generate_orders(self, customers, stores, employees, products, num_orders=5000):
-        """Generate order data"""
-        orders = []
-        order_details = []
-        
-        for i in range(1, num_orders + 1):
-            customer = random.choice(customers)
-            store = random.choice(stores)
-            employee = random.choice([e for e in employees if e['STORE_ID'] == store['STORE_ID']])
-            
-            # Generate order date within last 2 years
-            order_date = datetime.now().date() - timedelta(days=random.randint(0, 730))
-            required_date = order_date + timedelta(days=random.randint(1, 14))
-            ship_date = order_date + timedelta(days=random.randint(1, 7)) if random.random() < 0.8 else None
-            
-            # Order status based on dates
-            if ship_date and ship_date < datetime.now().date():
-                order_status = random.choice(['Delivered', 'Shipped'])
-            elif ship_date:
-                order_status = 'Shipped'
-            else:
-                order_status = random.choice(['Pending', 'Processing'])
-            
-            # Generate order details (1-5 products per order)
-            num_products = random.randint(1, 5)
-            order_products = random.sample(products, min(num_products, len(products)))
-            
-            total_amount = 0
-            tax_amount = 0
-            shipping_cost = random.randint(0, 500)
-            discount_amount = 0
-            
-            # Create order details
-            for product in order_products:
-                quantity = random.randint(1, 5)
-                unit_price = product['UNIT_PRICE']
-                
-                # Apply random discount (0-20%)
-                discount_percent = random.uniform(0, 0.2)
-                discount_amount += (unit_price * quantity * discount_percent)
-                
-                line_amount = unit_price * quantity * (1 - discount_percent)
-                total_amount += line_amount
-                
-                order_details.append({
-                    'ORDER_ID': i,
-                    'PRODUCT_ID': product['PRODUCT_ID'],
-                    'QUANTITY_ORDERED': quantity,
-                    'UNIT_PRICE': unit_price,
-                    'DISCOUNT_PERCENT': round(discount_percent * 100, 2),
-                    'TOTAL_LINE_AMOUNT': round(line_amount, 2)
-                })
-            
-            # Calculate tax (15% GST in Pakistan)
-            tax_amount = total_amount * 0.15
-            final_amount = total_amount + tax_amount + shipping_cost - discount_amount
-            
-            orders.append({
-                'ORDER_ID': i,
-                'CUSTOMER_ID': customer['CUSTOMER_ID'],
-                'STORE_ID': store['STORE_ID'],
-                'EMPLOYEE_ID': employee['EMPLOYEE_ID'],
-                'ORDER_DATE': order_date,
-                'REQUIRED_DATE': required_date,
-                'SHIP_DATE': ship_date,
-                'ORDER_STATUS': order_status,
-                'SHIP_METHOD': random.choice(self.shipping_methods),
-                'SHIPPING_ADDRESS_ID': None,  # Will be set later
-                'TOTAL_AMOUNT': round(total_amount, 2),
-                'TAX_AMOUNT': round(tax_amount, 2),
-                'SHIPPING_COST': shipping_cost,
-                'DISCOUNT_AMOUNT': round(discount_amount, 2),
-                'FINAL_AMOUNT': round(final_amount, 2),
-                'PAYMENT_METHOD': random.choice(self.payment_methods),
-                'PAYMENT_STATUS': 'Completed' if order_status in ['Delivered', 'Shipped'] else 'Pending',
-                'NOTES': f"Order placed by {customer['FIRST_NAME']} {customer['LAST_NAME']}"
-            })
-        
+    def _bulk_phones(self, n):
+        """Generate n mobile numbers in the +92-3XX-XXXXXXX format"""
+        return ('+92-' + pd.Series(self.rng.integers(300, 350, n)).astype(str)
+                + '-' + pd.Series(self.rng.integers(1000000, 10000000, n)).astype(str))
+
+    @staticmethod
+    def _bulk_emails(first_names, last_names, domains):
+        """Build first.last@domain email addresses from name columns"""
+        return first_names.str.lower() + '.' + last_names.str.lower() + '@' + domains
+
+    def _random_locations(self, n):
+        """Pick n random provinces and a random city within each one"""
+        province_idx = self.rng.integers(0, len(self._province_names), n)
+        cities = self._choose_within(province_idx, [self._cities_by_province[p] for p in self._province_names])
+        return np.array(self._province_names)[province_idx], cities
+
+    def _choose_within(self, group_idx, groups):
+        """For each row pick a random item from the group selected by group_idx"""
+        sizes = np.array([len(group) for group in groups])
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        items = np.array([item for group in groups for item in group])
+        return items[offsets[group_idx] + self.rng.integers(0, sizes[group_idx])]
+
+    def generate_orders(self, customers, stores, employees, products, num_orders=5000, batch_size=50000,
+                        max_workers=None):
+        """Generate order data in batches, spread across worker processes when max_workers > 1"""
+        customer_ids = customers['CUSTOMER_ID'].to_numpy()
+        customer_names = (customers['FIRST_NAME'] + ' ' + customers['LAST_NAME']).to_numpy()
+        
+        # Group employees by store once; orders are only placed at stores that have staff
+        staff_order = np.argsort(employees['STORE_ID'].to_numpy(), kind='stable')
+        employee_ids_by_store = employees['EMPLOYEE_ID'].to_numpy()[staff_order]
+        staffed_store_ids, store_staff_offsets, store_staff_counts = np.unique(
+            employees['STORE_ID'].to_numpy()[staff_order], return_index=True, return_counts=True)
+        
+        product_ids = products['PRODUCT_ID'].to_numpy()
+        product_prices = products['UNIT_PRICE'].to_numpy()
+        shipping_methods = np.array(self.shipping_methods)
+        payment_methods = np.array(self.payment_methods)
+        
+        batch_starts = list(range(1, num_orders + 1, batch_size))
+        batch_sizes = [min(batch_size, num_orders + 1 - start) for start in batch_starts]
+        batch_seeds = self.seed_sequence.spawn(len(batch_starts))
+        
+        lookups = (customer_ids, customer_names, staffed_store_ids, store_staff_offsets, store_staff_counts,
+                   employee_ids_by_store, product_ids, product_prices, shipping_methods, payment_methods)
+        if max_workers is not None and max_workers > 1 and len(batch_starts) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_generate_order_batch, seed, self.today, start, size, *lookups)
+                           for seed, start, size in zip(batch_seeds, batch_starts, batch_sizes)]
+                batches = [future.result() for future in futures]
+        else:
+            # Without an explicit pool size or several batches to spread, skip the pool startup and pickling
+            batches = [_generate_order_batch(seed, self.today, start, size, *lookups)
+                       for seed, start, size in zip(batch_seeds, batch_starts, batch_sizes)]
+        
+        orders = pd.concat([batch_orders for batch_orders, _ in batches], ignore_index=True)
+        order_details = pd.concat([batch_details for _, batch_details in batches], ignore_index=True)
         return orders, order_details
 
-    def generate_all_data(self, num_customers=1000, num_products=500, num_stores=50, num_employees=200, num_orders=5000):
+    def generate_all_data(self, num_customers=1000, num_products=500, num_stores=50, num_employees=200, num_orders=5000,
+                          max_workers=None):
         """Generate all data sets"""
         print("Generating Pakistan Sales Data...")
         
-        # Generate base data
-        customers = self.generate_customers(num_customers)
-        customer_addresses = self.generate_customer_addresses(customers)
+        # Each base table draws from its own spawned stream, so output is the same inline or pooled
+        customers_seed, products_seed, stores_seed = self.seed_sequence.spawn(3)
         product_categories = self.generate_product_categories()
-        products = self.generate_products(num_products)
-        stores = self.generate_stores(num_stores)
+        if max_workers is not None and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                customers_future = executor.submit(_run_in_worker, self, 'generate_customers', customers_seed,
+                                                   num_customers)
+                products_future = executor.submit(_run_in_worker, self, 'generate_products', products_seed,
+                                                  num_products)
+                stores_future = executor.submit(_run_in_worker, self, 'generate_stores', stores_seed, num_stores)
+                customers = customers_future.result()
+                products = products_future.result()
+                stores = stores_future.result()
+        else:
+            # The vectorized generators are faster inline than the cost of starting and feeding a pool
+            rng = self.rng
+            customers = _run_in_worker(self, 'generate_customers', customers_seed, num_customers)
+            products = _run_in_worker(self, 'generate_products', products_seed, num_products)
+            stores = _run_in_worker(self, 'generate_stores', stores_seed, num_stores)
+            self.rng = rng
+        
+        # Generate data that depends on the base tables
+        customer_addresses = self.generate_customer_addresses(customers)
         employees = self.generate_employees(stores, num_employees)
-        orders, order_details = self.generate_orders(customers, stores, employees, products, num_orders)
-        
-        # Create consolidated sales data for CSV export
-        sales_data = []
-        for order in orders:
-            order_detail = next((od for od in order_details if od['ORDER_ID'] == order['ORDER_ID']), None)
-            if order_detail:
-                customer = next((c for c in customers if c['CUSTOMER_ID'] == order['CUSTOMER_ID']), None)
-                product = next((p for p in products if p['PRODUCT_ID'] == order_detail['PRODUCT_ID']), None)
-                store = next((s for s in stores if s['STORE_ID'] == order['STORE_ID']), None)
-                employee = next((e for e in employees if e['EMPLOYEE_ID'] == order['EMPLOYEE_ID']), None)
-                
-                if all([customer, product, store, employee]):
-                    sales_data.append({
-                        'ORDER_ID': order['ORDER_ID'],
-                        'CUSTOMER_ID': order['CUSTOMER_ID'],
-                        'PRODUCT_ID': order_detail['PRODUCT_ID'],
-                        'STORE_ID': order['STORE_ID'],
-                        'EMPLOYEE_ID': order['EMPLOYEE_ID'],
-                        'ORDER_DATE': order['ORDER_DATE'],
-                        'SHIP_DATE': order['SHIP_DATE'],
-                        'QUANTITY_ORDERED': order_detail['QUANTITY_ORDERED'],
-                        'UNIT_PRICE': order_detail['UNIT_PRICE'],
-                        'DISCOUNT_PERCENT': order_detail['DISCOUNT_PERCENT'],
-                        'TOTAL_AMOUNT': order_detail['TOTAL_LINE_AMOUNT'],
-                        'PAYMENT_METHOD': order['PAYMENT_METHOD'],
-                        'ORDER_STATUS': order['ORDER_STATUS'],
-                        'SHIP_METHOD': order['SHIP_METHOD']
-                    })
+        orders, order_details = self.generate_orders(customers, stores, employees, products, num_orders,
+                                                     max_workers=max_workers)
         
         return {
             'customers': customers,
@@ -452,31 +567,82 @@ class PakistanSalesDataGenerator:
             'stores': stores,
             'employees': employees,
             'orders': orders,
-            'order_details': order_details,
-            'sales_data': sales_data
+            'order_details': order_details
         }
 
     def export_to_csv(self, data, output_dir='.'):
         """Export data to CSV files"""
         os.makedirs(output_dir, exist_ok=True)
         
-        # Export individual tables
-        for table_name, table_data in data.items():
-            if table_data:  # Skip empty tables
+        # Export individual tables plus the consolidated sales data
+        for table_name, table_data in self._export_tables(data):
+            if len(table_data):  # Skip empty tables
                 filename = f"pakistan_{table_name}.csv"
                 filepath = os.path.join(output_dir, filename)
                 
-                df = pd.DataFrame(table_data)
-                df.to_csv(filepath, index=False)
+                table = self._to_arrow_table(table_data)
+                pacsv.write_csv(table, filepath, write_options=pacsv.WriteOptions(include_header=True))
                 print(f"Exported {len(table_data)} records to {filename}")
         
-        # Export main sales data file
-        sales_filepath = os.path.join(output_dir, 'pakistan_sales_data.csv')
-        sales_df = pd.DataFrame(data['sales_data'])
-        sales_df.to_csv(sales_filepath, index=False)
-        print(f"Exported {len(data['sales_data'])} sales records to pakistan_sales_data.csv")
+        return os.path.join(output_dir, 'pakistan_sales_data.csv')
+
+    def _export_tables(self, data):
+        """Yield each table to export, deriving the consolidated sales data last"""
+        yield from data.items()
+        yield 'sales_data', self.build_sales_data(data['orders'], data['order_details'])
+
+    @staticmethod
+    def build_sales_data(orders, order_details):
+        """Join orders with their first line item into the consolidated sales data"""
+        # IDs in orders/order_details always reference generated rows, so no dimension joins are needed
+        order_columns = ['ORDER_ID', 'CUSTOMER_ID', 'STORE_ID', 'EMPLOYEE_ID', 'ORDER_DATE', 'SHIP_DATE',
+                         'PAYMENT_METHOD', 'ORDER_STATUS', 'SHIP_METHOD']
+        detail_columns = ['ORDER_ID', 'PRODUCT_ID', 'QUANTITY_ORDERED', 'UNIT_PRICE', 'DISCOUNT_PERCENT',
+                          'TOTAL_LINE_AMOUNT']
+        first_details = order_details[detail_columns].drop_duplicates('ORDER_ID')
+        sales_data = (
+            orders[order_columns]
+            .merge(first_details, on='ORDER_ID')
+            .rename(columns={'TOTAL_LINE_AMOUNT': 'TOTAL_AMOUNT'})
+        )
+        return sales_data[['ORDER_ID', 'CUSTOMER_ID', 'PRODUCT_ID', 'STORE_ID', 'EMPLOYEE_ID', 'ORDER_DATE',
+                           'SHIP_DATE', 'QUANTITY_ORDERED', 'UNIT_PRICE', 'DISCOUNT_PERCENT', 'TOTAL_AMOUNT',
+                           'PAYMENT_METHOD', 'ORDER_STATUS', 'SHIP_METHOD']]
+
+    def _to_arrow_table(self, df):
+        """Convert a generated table to Arrow with an explicit export schema"""
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        for i, field in enumerate(schema):
+            if field.name in self.categorical_columns:
+                schema = schema.set(i, pa.field(field.name, pa.dictionary(pa.int8(), pa.string())))
+            elif field.name.endswith('_ID'):
+                schema = schema.set(i, pa.field(field.name, pa.int32()))
+            elif pa.types.is_timestamp(field.type):
+                schema = schema.set(i, pa.field(field.name, pa.date32()))
+        return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+    def export_to_parquet(self, data, output_dir='.'):
+        """Export data to Snappy-compressed Parquet files"""
+        os.makedirs(output_dir, exist_ok=True)
+        
+        for table_name, table_data in self._export_tables(data):
+            if len(table_data):  # Skip empty tables
+                table = self._to_arrow_table(table_data)
+                
+                if table_name in self.date_partitioned_tables:
+                    # Hive-style YEAR=/MONTH= directories so readers can skip partitions by date
+                    filename = f"pakistan_{table_name}"
+                    table = (table.append_column('YEAR', pc.year(table['ORDER_DATE']))
+                             .append_column('MONTH', pc.month(table['ORDER_DATE'])))
+                    pq.write_to_dataset(table, os.path.join(output_dir, filename), partition_cols=['YEAR', 'MONTH'],
+                                        compression='snappy', existing_data_behavior='delete_matching',
+                                        max_rows_per_group=1000000)
+                else:
+                    filename = f"pakistan_{table_name}.parquet"
+                    pq.write_table(table, os.path.join(output_dir, filename), compression='snappy')
+                print(f"Exported {len(table_data)} records to {filename}")
         
-        return sales_filepath
+        return os.path.join(output_dir, 'pakistan_sales_data')
 
 def main():
     """Main function to generate and export data"""
@@ -491,12 +657,13 @@ def main():
         num_orders=10000         # 10K orders
     )
     
-    # Export to CSV files
+    # Export to CSV and Parquet files
     output_dir = 'pakistan_sales_data'
     sales_file = generator.export_to_csv(data, output_dir)
+    generator.export_to_parquet(data, output_dir)
     
     print(f"\n✅ Pakistan Sales Data Generation Complete!")
-    print(f"📊 Generated {len(data['sales_data'])} sales records")
+    print(f"📊 Generated {len(data['order_details'])} sales line items")
     print(f"👥 Generated {len(data['customers'])} customers")
     print(f"🏪 Generated {len(data['stores'])} stores")
     print(f"📦 Generated {len(data['products'])} products")
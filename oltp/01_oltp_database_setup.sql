@@ -63,6 +63,7 @@ CREATE OR REPLACE FILE FORMAT STAGING.CSV_FORMAT
     FIELD_DELIMITER = ','
     RECORD_DELIMITER = '\n'
     SKIP_HEADER = 1
+    FIELD_OPTIONALLY_ENCLOSED_BY = '"'
     NULL_IF = ('NULL', 'null', '')
     EMPTY_FIELD_AS_NULL = TRUE
     TRIM_SPACE = TRUE
@@ -11,10 +11,32 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import snowflake.connector
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from collections import Counter
+from itertools import combinations, count
+import atexit
+import hashlib
+import os
+import threading
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import scipy.sparse as sp
+except ImportError:  # Fall back to pure-Python pair counting
+    sp = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy version below is used instead
+    njit = None
+
 # Page configuration
 st.set_page_config(
     page_title="Pakistan Sales Analytics Dashboard",
@@ -46,8 +68,8 @@ st.markdown("""
 
 # Snowflake connection configuration
 @st.cache_resource
-def get_snowflake_connection():
-    """Create Snowflake connection"""
+def get_snowflake_connection(name="default"):
+    """Create Snowflake connection (cached per name)"""
     try:
         conn = snowflake.connector.connect(
             user=st.secrets["snowflake"]["user"],
@@ -55,18 +77,145 @@ def get_snowflake_connection():
             account=st.secrets["snowflake"]["account"],
             warehouse=st.secrets["snowflake"]["warehouse"],
             database=st.secrets["snowflake"]["database"],
-            schema=st.secrets["snowflake"]["schema"]
+            schema=st.secrets["snowflake"]["schema"],
+            client_session_keep_alive=True,
+            session_parameters={"PYTHON_CONNECTOR_QUERY_RESULT_FORMAT": "ARROW"}
         )
+        # The connection lives for the whole process; close it on shutdown
+        atexit.register(conn.close)
         return conn
     except Exception as e:
         st.error(f"Failed to connect to Snowflake: {e}")
         return None
 
+# Loader threads each hold their own connection, since cursors on one session run one at a time
+_worker = threading.local()
+
+def assign_worker_connection(slots):
+    """Thread pool initializer: name the connection for this worker after its pool slot"""
+    _worker.connection_name = f"worker-{next(slots)}"
+
+def get_worker_connection():
+    """Get the Snowflake connection for the current loader thread"""
+    return get_snowflake_connection(getattr(_worker, 'connection_name', "default"))
+
+def fetch_dataframe(conn, query, params=None):
+    """Run a query and fetch the result as a DataFrame through Arrow batches"""
+    cur = conn.cursor()
+    try:
+        cur.execute(query, params)
+        return cur.fetch_pandas_all()
+    finally:
+        cur.close()
+
+# Local Feather copies of large query results, reused across reruns and restarts
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pk_dashboard")
+CACHE_TTL_SECONDS = 3600
+
+def remove_expired_cache_files():
+    """Delete cached results and leftover temporary files older than the cache TTL"""
+    cutoff = time.time() - CACHE_TTL_SECONDS
+    for entry in os.scandir(CACHE_DIR):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:  # Already removed by another session
+            pass
+
+def fetch_cached_table(conn, query, params=None):
+    """Fetch a query result as an Arrow table, reusing the local Feather copy while it is fresh"""
+    # Key on the target account and database too, so switching secrets never serves another source's data
+    key = hashlib.sha256(repr((conn.account, conn.database, conn.schema, query, params)).encode()).hexdigest()[:16]
+    path = os.path.join(CACHE_DIR, key + ".feather")
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL_SECONDS:
+            return feather.read_table(path, memory_map=True)
+    except (OSError, pa.ArrowInvalid):  # Missing or unreadable cache file; query Snowflake instead
+        pass
+    
+    cur = conn.cursor()
+    try:
+        cur.execute(query, params)
+        batches = list(cur.fetch_arrow_batches())
+        # The connector yields each result chunk as a pyarrow Table
+        table = pa.concat_tables(batches) if batches else cur.fetch_arrow_all(force_return_table=True)
+    finally:
+        cur.close()
+    
+    # Write to a temporary file first so concurrent sessions never read a partial cache.
+    # The cache is only a speed-up, so a read-only or full disk must not fail the load.
+    # Results hold customer and employee names, so the cache is private to the current user.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        remove_expired_cache_files()
+        feather.write_feather(table, tmp_path, compression="zstd")
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return table
+
+# Low-cardinality text columns stored as categoricals so filters and groupings compare integer codes
+SALES_CATEGORY_COLUMNS = ['STORE_PROVINCE', 'STORE_CITY', 'PRIMARY_PROVINCE', 'CUSTOMER_SEGMENT', 'PRODUCT_NAME',
+                          'MONTH_NAME', 'CATEGORY_NAME', 'BRAND', 'DEPARTMENT']
+CUSTOMER_CATEGORY_COLUMNS = ['PRIMARY_PROVINCE', 'CUSTOMER_SEGMENT', 'AGE_GROUP', 'INCOME_BAND']
+
+def to_categories(df, columns):
+    """Convert the given text columns to the category dtype"""
+    return df.astype({col: 'category' for col in columns if col in df.columns})
+
+# Measures downcast to 32-bit (or smaller) types right after fetching
+SALES_FLOAT_COLUMNS = ['FINAL_LINE_AMOUNT', 'UNIT_PRICE', 'DISCOUNT_PERCENT']
+SALES_INT_COLUMNS = ['QUANTITY_ORDERED']
+CUSTOMER_FLOAT_COLUMNS = ['TOTAL_SPENT']
+CUSTOMER_INT_COLUMNS = ['TOTAL_ORDERS']
+
+def downcast_numeric(df, float_columns, int_columns):
+    """Downcast the given measure columns to the smallest float and integer types that hold them"""
+    for col in float_columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in int_columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+# Sidebar filters, applied in SQL
+DATE_RANGE_DAYS = {
+    "Last 30 Days": 30,
+    "Last 3 Months": 90,
+    "Last 6 Months": 180,
+    "Last Year": 365
+}
+
+SALES_FILTER_JOINS = """
+        FROM FACTS.FACT_SALES fs
+        JOIN DIMENSIONS.DIM_CUSTOMER dc ON fs.CUSTOMER_KEY = dc.CUSTOMER_KEY
+        JOIN DIMENSIONS.DIM_STORE ds ON fs.STORE_KEY = ds.STORE_KEY
+"""
+
+def build_sales_filters(date_range, provinces, segments):
+    """Build the WHERE clause and bind parameters for the sidebar filters"""
+    conditions, params = [], []
+    if date_range in DATE_RANGE_DAYS:
+        conditions.append("fs.ORDER_DATE >= DATEADD(day, %s, CURRENT_DATE())")
+        params.append(-DATE_RANGE_DAYS[date_range])
+    if provinces:
+        conditions.append(f"ds.PROVINCE IN ({', '.join(['%s'] * len(provinces))})")
+        params.extend(provinces)
+    if segments:
+        conditions.append(f"dc.CUSTOMER_SEGMENT IN ({', '.join(['%s'] * len(segments))})")
+        params.extend(segments)
+    where = "WHERE " + " AND ".join(conditions) if conditions else ""
+    return where, params
+
 # Data loading functions
-@st.cache_data(ttl=3600)
-def load_sales_data():
-    """Load sales data from Snowflake"""
-    conn = get_snowflake_connection()
+@st.cache_data(ttl=3600, max_entries=32)
+def load_sales_data(date_range, provinces, segments):
+    """Load sales data from Snowflake for the selected date range, store provinces and customer segments"""
+    conn = get_worker_connection()
     if conn is None:
         return None
     
@@ -85,11 +234,14 @@ def load_sales_data():
         JOIN DIMENSIONS.DIM_PRODUCT dp ON fs.PRODUCT_KEY = dp.PRODUCT_KEY
         JOIN DIMENSIONS.DIM_STORE ds ON fs.STORE_KEY = ds.STORE_KEY
         JOIN DIMENSIONS.DIM_EMPLOYEE de ON fs.EMPLOYEE_KEY = de.EMPLOYEE_KEY
+        {where}
         LIMIT 10000
         """
         
-        df = pd.read_sql(query, conn)
-        conn.close()
+        where, params = build_sales_filters(date_range, provinces, segments)
+        table = fetch_cached_table(conn, query.format(where=where), params)
+        df = table.to_pandas(split_blocks=True, self_destruct=True, date_as_object=False)
+        df = downcast_numeric(to_categories(df, SALES_CATEGORY_COLUMNS), SALES_FLOAT_COLUMNS, SALES_INT_COLUMNS)
         return df
     except Exception as e:
         st.error(f"Failed to load data: {e}")
@@ -98,7 +250,7 @@ def load_sales_data():
 @st.cache_data(ttl=3600)
 def load_customer_behavior():
     """Load customer behavior data"""
-    conn = get_snowflake_connection()
+    conn = get_worker_connection()
     if conn is None:
         return None
     
@@ -112,100 +264,187 @@ def load_customer_behavior():
         JOIN DIMENSIONS.DIM_CUSTOMER dc ON cb.CUSTOMER_KEY = dc.CUSTOMER_KEY
         """
         
-        df = pd.read_sql(query, conn)
-        conn.close()
+        df = to_categories(fetch_dataframe(conn, query), CUSTOMER_CATEGORY_COLUMNS)
+        df = downcast_numeric(df, CUSTOMER_FLOAT_COLUMNS, CUSTOMER_INT_COLUMNS)
         return df
     except Exception as e:
         st.error(f"Failed to load customer behavior data: {e}")
         return None
 
-@st.cache_data(ttl=3600)
-def load_monthly_aggregates():
-    """Load monthly sales aggregates"""
-    conn = get_snowflake_connection()
+# Aggregated chart data (grouped in Snowflake, filtered by the sidebar selections)
+def load_sales_aggregate(query, params, description):
+    """Run an aggregated sales query"""
+    conn = get_worker_connection()
     if conn is None:
         return None
     
     try:
-        query = """
-        SELECT * FROM AGGREGATES.AGG_MONTHLY_SALES
-        ORDER BY YEAR, MONTH
-        """
-        
-        df = pd.read_sql(query, conn)
-        conn.close()
-        return df
+        return fetch_dataframe(conn, query, params)
     except Exception as e:
-        st.error(f"Failed to load monthly aggregates: {e}")
+        st.error(f"Failed to load {description}: {e}")
         return None
 
-# Main dashboard
-def main():
-    # Header
-    st.markdown('<h1 class="main-header">🇵🇰 Pakistan Sales Analytics Dashboard</h1>', unsafe_allow_html=True)
-    
-    # Sidebar
-    st.sidebar.title("📊 Dashboard Controls")
-    
-    # Date range filter
-    st.sidebar.subheader("📅 Date Range")
-    date_range = st.sidebar.selectbox(
-        "Select Date Range",
-        ["Last 30 Days", "Last 3 Months", "Last 6 Months", "Last Year", "All Time"]
-    )
-    
-    # Province filter
-    st.sidebar.subheader("🏛️ Province Filter")
-    province_filter = st.sidebar.multiselect(
-        "Select Provinces",
-        ["Punjab", "Sindh", "Khyber Pakhtunkhwa", "Balochistan", "Gilgit-Baltistan", "Azad Kashmir"],
-        default=["Punjab", "Sindh"]
-    )
-    
-    # Customer segment filter
-    st.sidebar.subheader("👥 Customer Segment")
-    segment_filter = st.sidebar.multiselect(
-        "Select Segments",
-        ["Premium", "Regular", "Occasional", "VIP"],
-        default=["Premium", "Regular"]
-    )
-    
-    # Load data
-    with st.spinner("Loading data from Snowflake..."):
-        sales_df = load_sales_data()
-        customer_df = load_customer_behavior()
-        monthly_df = load_monthly_aggregates()
-    
-    if sales_df is None or customer_df is None or monthly_df is None:
-        st.error("Failed to load data. Please check your Snowflake connection.")
-        return
-    
-    # Apply filters
-    if date_range != "All Time":
-        days_map = {
-            "Last 30 Days": 30,
-            "Last 3 Months": 90,
-            "Last 6 Months": 180,
-            "Last Year": 365
-        }
-        cutoff_date = datetime.now() - timedelta(days=days_map[date_range])
-        sales_df = sales_df[sales_df['ORDER_DATE'] >= cutoff_date]
-    
-    if province_filter:
-        sales_df = sales_df[sales_df['STORE_PROVINCE'].isin(province_filter)]
-        customer_df = customer_df[customer_df['PRIMARY_PROVINCE'].isin(province_filter)]
-    
-    if segment_filter:
-        sales_df = sales_df[sales_df['CUSTOMER_SEGMENT'].isin(segment_filter)]
-        customer_df = customer_df[customer_df['CUSTOMER_SEGMENT'].isin(segment_filter)]
-    
-    # Main metrics row
+@st.cache_data(ttl=3600)
+def load_kpis(date_range, provinces, segments):
+    """Load the headline sales KPIs in a single pass over the filtered sales"""
+    where, params = build_sales_filters(date_range, provinces, segments)
+    query = f"""
+        SELECT
+            SUM(fs.FINAL_LINE_AMOUNT) AS TOTAL_SALES,
+            COUNT(DISTINCT fs.ORDER_ID) AS TOTAL_ORDERS,
+            COUNT(DISTINCT fs.CUSTOMER_KEY) AS UNIQUE_CUSTOMERS,
+            AVG(fs.FINAL_LINE_AMOUNT) AS AVG_ORDER_VALUE
+        {SALES_FILTER_JOINS}
+        {where}
+        """
+    return load_sales_aggregate(query, params, "KPIs")
+
+@st.cache_data(ttl=3600)
+def load_monthly_sales(date_range, provinces, segments):
+    """Load sales totals by month"""
+    where, params = build_sales_filters(date_range, provinces, segments)
+    query = f"""
+        SELECT dt.YEAR, dt.MONTH, dt.MONTH_NAME, SUM(fs.FINAL_LINE_AMOUNT) AS FINAL_LINE_AMOUNT
+        {SALES_FILTER_JOINS}
+        JOIN DIMENSIONS.DIM_TIME dt ON fs.TIME_KEY = dt.TIME_KEY
+        {where}
+        GROUP BY dt.YEAR, dt.MONTH, dt.MONTH_NAME
+        ORDER BY dt.YEAR, dt.MONTH
+        """
+    return load_sales_aggregate(query, params, "monthly sales")
+
+@st.cache_data(ttl=3600)
+def load_province_sales(date_range, provinces, segments):
+    """Load sales totals by store province"""
+    where, params = build_sales_filters(date_range, provinces, segments)
+    query = f"""
+        SELECT ds.PROVINCE AS STORE_PROVINCE, SUM(fs.FINAL_LINE_AMOUNT) AS FINAL_LINE_AMOUNT
+        {SALES_FILTER_JOINS}
+        {where}
+        GROUP BY ds.PROVINCE
+        """
+    return load_sales_aggregate(query, params, "province sales")
+
+@st.cache_data(ttl=3600)
+def load_top_products(date_range, provinces, segments, n=10):
+    """Load the top products by revenue"""
+    where, params = build_sales_filters(date_range, provinces, segments)
+    query = f"""
+        SELECT dp.PRODUCT_NAME, SUM(fs.FINAL_LINE_AMOUNT) AS FINAL_LINE_AMOUNT
+        {SALES_FILTER_JOINS}
+        JOIN DIMENSIONS.DIM_PRODUCT dp ON fs.PRODUCT_KEY = dp.PRODUCT_KEY
+        {where}
+        GROUP BY dp.PRODUCT_NAME
+        ORDER BY FINAL_LINE_AMOUNT DESC
+        LIMIT %s
+        """
+    return load_sales_aggregate(query, params + [n], "top products")
+
+@st.cache_data(ttl=3600)
+def load_segment_sales(date_range, provinces, segments):
+    """Load sales totals by customer segment"""
+    where, params = build_sales_filters(date_range, provinces, segments)
+    query = f"""
+        SELECT dc.CUSTOMER_SEGMENT, SUM(fs.FINAL_LINE_AMOUNT) AS FINAL_LINE_AMOUNT
+        {SALES_FILTER_JOINS}
+        {where}
+        GROUP BY dc.CUSTOMER_SEGMENT
+        """
+    return load_sales_aggregate(query, params, "segment sales")
+
+@st.cache_data(ttl=3600)
+def load_age_group_sales(date_range, provinces, segments):
+    """Load sales totals by customer age group"""
+    where, params = build_sales_filters(date_range, provinces, segments)
+    query = f"""
+        SELECT dc.AGE_GROUP, SUM(fs.FINAL_LINE_AMOUNT) AS FINAL_LINE_AMOUNT
+        {SALES_FILTER_JOINS}
+        {where}
+        GROUP BY dc.AGE_GROUP
+        """
+    return load_sales_aggregate(query, params, "age group sales")
+
+@st.cache_data(ttl=3600)
+def load_store_performance(date_range, provinces, segments, n=100):
+    """Load order, revenue and customer totals for the n best-selling stores"""
+    where, params = build_sales_filters(date_range, provinces, segments)
+    query = f"""
+        SELECT
+            ds.STORE_NAME, ds.PROVINCE AS STORE_PROVINCE, ds.CITY AS STORE_CITY,
+            COUNT(DISTINCT fs.ORDER_ID) AS ORDERS,
+            SUM(fs.FINAL_LINE_AMOUNT) AS TOTAL_SALES,
+            COUNT(DISTINCT fs.CUSTOMER_KEY) AS UNIQUE_CUSTOMERS
+        {SALES_FILTER_JOINS}
+        {where}
+        GROUP BY ds.STORE_NAME, ds.PROVINCE, ds.CITY
+        ORDER BY TOTAL_SALES DESC
+        LIMIT %s
+        """
+    return load_sales_aggregate(query, params + [n], "store performance")
+
+def top_product_pairs(sales_df, n=10):
+    """Count products bought together in the same order and return the n most frequent pairs"""
+    if sales_df.empty:  # No sales match the filters
+        return []
+    
+    order_idx, _ = pd.factorize(sales_df['ORDER_ID'])
+    product_idx, products = pd.factorize(sales_df['PRODUCT_NAME'])
+    
+    if sp is None:
+        # Collect each order's products into an Arrow list array and only walk orders with several items
+        baskets = pa.table({'ORDER': order_idx, 'PRODUCT': product_idx}).group_by('ORDER').aggregate(
+            [('PRODUCT', 'list')])['PRODUCT_list']
+        baskets = baskets.filter(pc.greater(pc.list_value_length(baskets), 1))
+        co_occurrences = Counter(pair for basket in baskets.to_pylist() for pair in combinations(sorted(basket), 2)
+                                 if pair[0] != pair[1])
+        return [(tuple(sorted((products[a], products[b]))), count) for (a, b), count in co_occurrences.most_common(n)]
+    
+    # Order x product incidence matrix; its Gram matrix holds every pairwise co-purchase count
+    incidence = sp.csr_matrix((np.ones(len(product_idx)), (order_idx, product_idx)))
+    co = sp.triu(incidence.T @ incidence, k=1).tocoo()
+    
+    top = np.argpartition(-co.data, n)[:n] if co.nnz > n else np.arange(co.nnz)
+    top = top[np.argsort(-co.data[top], kind='stable')]
+    return [(tuple(sorted((products[co.row[i]], products[co.col[i]]))), int(co.data[i])) for i in top]
+
+def month_axis(df):
+    """Build a datetime64[M] month array from YEAR and MONTH columns"""
+    return ((df['YEAR'].to_numpy() - 1970) * 12 + df['MONTH'].to_numpy() - 1).astype('datetime64[M]')
+
+def moving_average_3(values):
+    """Trailing 3-month moving average (NaN until three months are available)"""
+    averages = np.full(values.shape, np.nan)
+    averages[2:] = (values[2:] + values[1:-1] + values[:-2]) / 3.0
+    return averages
+
+if njit is not None:
+    @njit(cache=True)
+    def moving_average_3(values):
+        """Trailing 3-month moving average from a running sum in a compiled loop"""
+        averages = np.full(values.shape, np.nan)
+        window_sum = 0.0
+        for i in range(values.size):
+            window_sum += values[i]
+            if i >= 3:
+                window_sum -= values[i - 3]
+            if i >= 2:
+                averages[i] = window_sum / 3.0
+        return averages
+
+def run_in_script_thread(ctx, loader, *args):
+    """Run a loader in a worker thread attached to the session's script context"""
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return loader(*args)
+
+# Dashboard sections
+def render_kpis(kpis):
+    """Render the KPI metrics row"""
     st.subheader("📈 Key Performance Indicators")
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_sales = sales_df['FINAL_LINE_AMOUNT'].sum()
+        total_sales = kpis['TOTAL_SALES']
         st.metric(
             label="💰 Total Sales (PKR)",
             value=f"PKR {total_sales:,.0f}",
@@ -213,7 +452,7 @@ def main():
         )
     
     with col2:
-        total_orders = sales_df['ORDER_ID'].nunique()
+        total_orders = int(kpis['TOTAL_ORDERS'])
         st.metric(
             label="📦 Total Orders",
             value=f"{total_orders:,}",
@@ -221,7 +460,7 @@ def main():
         )
     
     with col3:
-        total_customers = sales_df['CUSTOMER_KEY'].nunique()
+        total_customers = int(kpis['UNIQUE_CUSTOMERS'])
         st.metric(
             label="👥 Unique Customers",
             value=f"{total_customers:,}",
@@ -229,13 +468,15 @@ def main():
         )
     
     with col4:
-        avg_order_value = sales_df['FINAL_LINE_AMOUNT'].mean()
+        avg_order_value = kpis['AVG_ORDER_VALUE']
         st.metric(
             label="📊 Average Order Value",
             value=f"PKR {avg_order_value:,.0f}",
             delta=f"PKR {avg_order_value * 0.05:,.0f}"
         )
-    
+
+def render_sales_charts(monthly_sales, province_sales, top_products, segment_sales):
+    """Render the sales analytics charts"""
     # Charts row 1
     st.subheader("📊 Sales Analytics")
     
@@ -243,27 +484,20 @@ def main():
     
     with col1:
         # Monthly sales trend
-        monthly_sales = sales_df.groupby(['YEAR', 'MONTH', 'MONTH_NAME'])['FINAL_LINE_AMOUNT'].sum().reset_index()
-        monthly_sales['YEAR_MONTH'] = monthly_sales['YEAR'].astype(str) + '-' + monthly_sales['MONTH'].astype(str).str.zfill(2)
-        
         fig_monthly = px.line(
-            monthly_sales,
-            x='YEAR_MONTH',
-            y='FINAL_LINE_AMOUNT',
+            x=month_axis(monthly_sales),
+            y=monthly_sales['FINAL_LINE_AMOUNT'].to_numpy(dtype=np.float32),
             title='📈 Monthly Sales Trend',
-            labels={'FINAL_LINE_AMOUNT': 'Sales (PKR)', 'YEAR_MONTH': 'Month'}
+            labels={'y': 'Sales (PKR)', 'x': 'Month'}
         )
         fig_monthly.update_layout(height=400)
         st.plotly_chart(fig_monthly, use_container_width=True)
     
     with col2:
         # Sales by province
-        province_sales = sales_df.groupby('STORE_PROVINCE')['FINAL_LINE_AMOUNT'].sum().reset_index()
-        
         fig_province = px.pie(
-            province_sales,
-            values='FINAL_LINE_AMOUNT',
-            names='STORE_PROVINCE',
+            values=province_sales['FINAL_LINE_AMOUNT'].to_numpy(dtype=np.float32),
+            names=province_sales['STORE_PROVINCE'].to_numpy(),
             title='🏛️ Sales Distribution by Province'
         )
         fig_province.update_layout(height=400)
@@ -274,33 +508,29 @@ def main():
     
     with col1:
         # Top products by revenue
-        top_products = sales_df.groupby('PRODUCT_NAME')['FINAL_LINE_AMOUNT'].sum().nlargest(10).reset_index()
-        
         fig_products = px.bar(
-            top_products,
-            x='FINAL_LINE_AMOUNT',
-            y='PRODUCT_NAME',
+            x=top_products['FINAL_LINE_AMOUNT'].to_numpy(dtype=np.float32),
+            y=top_products['PRODUCT_NAME'].to_numpy(),
             orientation='h',
             title='🏆 Top 10 Products by Revenue',
-            labels={'FINAL_LINE_AMOUNT': 'Revenue (PKR)', 'PRODUCT_NAME': 'Product'}
+            labels={'x': 'Revenue (PKR)', 'y': 'Product'}
         )
         fig_products.update_layout(height=400)
         st.plotly_chart(fig_products, use_container_width=True)
     
     with col2:
         # Customer segment distribution
-        segment_sales = sales_df.groupby('CUSTOMER_SEGMENT')['FINAL_LINE_AMOUNT'].sum().reset_index()
-        
         fig_segment = px.bar(
-            segment_sales,
-            x='CUSTOMER_SEGMENT',
-            y='FINAL_LINE_AMOUNT',
+            x=segment_sales['CUSTOMER_SEGMENT'].to_numpy(),
+            y=segment_sales['FINAL_LINE_AMOUNT'].to_numpy(dtype=np.float32),
             title='👥 Sales by Customer Segment',
-            labels={'FINAL_LINE_AMOUNT': 'Sales (PKR)', 'CUSTOMER_SEGMENT': 'Segment'}
+            labels={'y': 'Sales (PKR)', 'x': 'Segment'}
         )
         fig_segment.update_layout(height=400)
         st.plotly_chart(fig_segment, use_container_width=True)
-    
+
+def render_customer_charts(customer_df, age_sales):
+    """Render the customer analytics charts"""
     # Charts row 3
     st.subheader("🎯 Customer Analytics")
     
@@ -308,33 +538,29 @@ def main():
     
     with col1:
         # RFM Analysis
-        rfm_counts = customer_df['RFM_SEGMENT'].value_counts().reset_index()
-        rfm_counts.columns = ['Segment', 'Count']
+        rfm_counts = customer_df['RFM_SEGMENT'].value_counts()
         
         fig_rfm = px.bar(
-            rfm_counts,
-            x='Segment',
-            y='Count',
+            x=rfm_counts.index.to_numpy(),
+            y=rfm_counts.to_numpy(dtype=np.int32),
             title='🎯 Customer RFM Segmentation',
-            labels={'Count': 'Number of Customers', 'Segment': 'RFM Segment'}
+            labels={'y': 'Number of Customers', 'x': 'RFM Segment'}
         )
         fig_rfm.update_layout(height=400)
         st.plotly_chart(fig_rfm, use_container_width=True)
     
     with col2:
         # Age group distribution
-        age_sales = sales_df.groupby('AGE_GROUP')['FINAL_LINE_AMOUNT'].sum().reset_index()
-        
         fig_age = px.pie(
-            age_sales,
-            values='FINAL_LINE_AMOUNT',
-            names='AGE_GROUP',
+            values=age_sales['FINAL_LINE_AMOUNT'].to_numpy(dtype=np.float32),
+            names=age_sales['AGE_GROUP'].to_numpy(),
             title='👴👵 Sales by Age Group'
         )
         fig_age.update_layout(height=400)
         st.plotly_chart(fig_age, use_container_width=True)
-    
-    # Advanced Analytics
+
+def render_advanced_analytics(sales_df, monthly_sales):
+    """Render the correlation and forecast charts"""
     st.subheader("🔬 Advanced Analytics")
     
     # Correlation analysis
@@ -345,7 +571,9 @@ def main():
         
         # Create correlation matrix for numerical columns
         numeric_cols = ['QUANTITY_ORDERED', 'UNIT_PRICE', 'DISCOUNT_PERCENT', 'FINAL_LINE_AMOUNT']
-        correlation_data = sales_df[numeric_cols].corr()
+        values = np.ascontiguousarray(sales_df[numeric_cols].to_numpy(dtype=np.float32).T)
+        values = values[:, ~np.isnan(values).any(axis=0)]  # Drop lines with a missing measure
+        correlation_data = pd.DataFrame(np.corrcoef(values), index=numeric_cols, columns=numeric_cols)
         
         fig_corr = px.imshow(
             correlation_data,
@@ -359,13 +587,12 @@ def main():
     with col2:
         st.subheader("📈 Sales Forecasting")
         
-        # Simple moving average forecast
-        monthly_agg = sales_df.groupby(['YEAR', 'MONTH'])['FINAL_LINE_AMOUNT'].sum().reset_index()
-        monthly_agg['YEAR_MONTH'] = monthly_agg['YEAR'].astype(str) + '-' + monthly_agg['MONTH'].astype(str).str.zfill(2)
-        monthly_agg = monthly_agg.sort_values('YEAR_MONTH')
+        # Simple moving average forecast over the monthly totals (already in month order)
+        monthly_agg = monthly_sales[['YEAR', 'MONTH', 'FINAL_LINE_AMOUNT']].copy()
+        monthly_agg['YEAR_MONTH'] = month_axis(monthly_agg)
         
         # Calculate 3-month moving average
-        monthly_agg['MA_3'] = monthly_agg['FINAL_LINE_AMOUNT'].rolling(window=3).mean()
+        monthly_agg['MA_3'] = moving_average_3(monthly_agg['FINAL_LINE_AMOUNT'].to_numpy(dtype=np.float64))
         
         fig_forecast = px.line(
             monthly_agg,
@@ -376,8 +603,9 @@ def main():
         )
         fig_forecast.update_layout(height=400)
         st.plotly_chart(fig_forecast, use_container_width=True)
-    
-    # Data Tables
+
+def render_data_tables(sales_df, customer_df, store_performance):
+    """Render the detailed data tabs"""
     st.subheader("📋 Detailed Data Views")
     
     tab1, tab2, tab3 = st.tabs(["📊 Sales Data", "👥 Customer Data", "🏪 Store Performance"])
@@ -397,17 +625,13 @@ def main():
         )
     
     with tab3:
-        store_performance = sales_df.groupby(['STORE_NAME', 'STORE_PROVINCE', 'STORE_CITY']).agg({
-            'ORDER_ID': 'nunique',
-            'FINAL_LINE_AMOUNT': 'sum',
-            'CUSTOMER_KEY': 'nunique'
-        }).reset_index()
         store_performance.columns = ['Store', 'Province', 'City', 'Orders', 'Total Sales', 'Unique Customers']
         store_performance['Avg Order Value'] = store_performance['Total Sales'] / store_performance['Orders']
         
-        st.dataframe(store_performance.sort_values('Total Sales', ascending=False).head(100), use_container_width=True)
-    
-    # Machine Learning Section
+        st.dataframe(store_performance, use_container_width=True)
+
+def render_ml_insights(sales_df, customer_df):
+    """Render the CLV and product recommendation panels"""
     st.subheader("🤖 Machine Learning Insights")
     
     col1, col2 = st.columns(2)
@@ -415,41 +639,27 @@ def main():
     with col1:
         st.subheader("🎯 Customer Lifetime Value Prediction")
         
-        # Simple CLV calculation based on historical data
-        clv_data = customer_df.copy()
-        clv_data['CLV'] = clv_data['TOTAL_SPENT'] * (clv_data['TOTAL_ORDERS'] / 12) * 12  # Annual projection
+        # Simple CLV calculation based on historical data (annual projection)
+        clv = customer_df['TOTAL_SPENT'].to_numpy(dtype=np.float32) * customer_df['TOTAL_ORDERS'].to_numpy(dtype=np.float32)
         
         fig_clv = px.histogram(
-            clv_data,
-            x='CLV',
+            x=clv,
             nbins=20,
             title='Customer Lifetime Value Distribution',
-            labels={'CLV': 'CLV (PKR)', 'count': 'Number of Customers'}
+            labels={'x': 'CLV (PKR)', 'count': 'Number of Customers'}
         )
         fig_clv.update_layout(height=400)
         st.plotly_chart(fig_clv, use_container_width=True)
         
         # CLV statistics
-        avg_clv = clv_data['CLV'].mean()
+        avg_clv = np.nanmean(clv)
         st.metric("Average CLV", f"PKR {avg_clv:,.0f}")
     
     with col2:
         st.subheader("📊 Product Recommendation Engine")
         
         # Simple product association based on co-purchases
-        product_pairs = sales_df.groupby('ORDER_ID')['PRODUCT_NAME'].apply(list).reset_index()
-        product_pairs = product_pairs[product_pairs['PRODUCT_NAME'].apply(len) > 1]
-        
-        # Count product co-occurrences
-        co_occurrences = {}
-        for products in product_pairs['PRODUCT_NAME']:
-            for i in range(len(products)):
-                for j in range(i+1, len(products)):
-                    pair = tuple(sorted([products[i], products[j]]))
-                    co_occurrences[pair] = co_occurrences.get(pair, 0) + 1
-        
-        # Top product pairs
-        top_pairs = sorted(co_occurrences.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_pairs = top_product_pairs(sales_df, 10)
         pair_df = pd.DataFrame(top_pairs, columns=['Product Pair', 'Co-occurrences'])
         
         fig_pairs = px.bar(
@@ -462,6 +672,81 @@ def main():
         )
         fig_pairs.update_layout(height=400)
         st.plotly_chart(fig_pairs, use_container_width=True)
+
+# Main dashboard
+def main():
+    # Header
+    st.markdown('<h1 class="main-header">🇵🇰 Pakistan Sales Analytics Dashboard</h1>', unsafe_allow_html=True)
+    
+    # Sidebar
+    st.sidebar.title("📊 Dashboard Controls")
+    
+    # Date range filter
+    st.sidebar.subheader("📅 Date Range")
+    date_range = st.sidebar.selectbox(
+        "Select Date Range",
+        ["Last 30 Days", "Last 3 Months", "Last 6 Months", "Last Year", "All Time"]
+    )
+    
+    # Province filter
+    st.sidebar.subheader("🏛️ Province Filter")
+    province_filter = st.sidebar.multiselect(
+        "Select Provinces",
+        ["Punjab", "Sindh", "Khyber Pakhtunkhwa", "Balochistan", "Gilgit-Baltistan", "Azad Kashmir"],
+        default=["Punjab", "Sindh"]
+    )
+    
+    # Customer segment filter
+    st.sidebar.subheader("👥 Customer Segment")
+    segment_filter = st.sidebar.multiselect(
+        "Select Segments",
+        ["Premium", "Regular", "Occasional", "VIP"],
+        default=["Premium", "Regular"]
+    )
+    
+    # Load data
+    provinces, segments = tuple(province_filter), tuple(segment_filter)
+    filters = (date_range, provinces, segments)
+    loads = [
+        (load_sales_data, filters),
+        (load_kpis, filters),
+        (load_customer_behavior, ()),
+        (load_monthly_sales, filters),
+        (load_province_sales, filters),
+        (load_top_products, filters),
+        (load_segment_sales, filters),
+        (load_age_group_sales, filters),
+        (load_store_performance, filters)
+    ]
+    with st.spinner("Loading data from Snowflake..."):
+        # Queries are I/O bound, so overlap their round-trips on a small thread pool,
+        # each worker querying on its own connection
+        ctx = get_script_run_ctx()
+        pool = ThreadPoolExecutor(max_workers=3, initializer=assign_worker_connection, initargs=(count(),))
+        with pool as executor:
+            futures = [executor.submit(run_in_script_thread, ctx, loader, *args) for loader, args in loads]
+            (sales_df, kpis, customer_df, monthly_sales, province_sales, top_products, segment_sales,
+             age_sales, store_performance) = [future.result() for future in futures]
+    
+    chart_data = [kpis, monthly_sales, province_sales, top_products, segment_sales, age_sales, store_performance]
+    if sales_df is None or customer_df is None or any(df is None for df in chart_data):
+        st.error("Failed to load data. Please check your Snowflake connection.")
+        return
+    
+    # Apply filters (sales data and chart aggregates are already filtered in Snowflake)
+    if province_filter:
+        customer_df = customer_df[customer_df['PRIMARY_PROVINCE'].isin(province_filter)]
+    
+    if segment_filter:
+        customer_df = customer_df[customer_df['CUSTOMER_SEGMENT'].isin(segment_filter)]
+    
+    # Render each dashboard section
+    render_kpis(kpis.iloc[0])
+    render_sales_charts(monthly_sales, province_sales, top_products, segment_sales)
+    render_customer_charts(customer_df, age_sales)
+    render_advanced_analytics(sales_df, monthly_sales)
+    render_data_tables(sales_df, customer_df, store_performance)
+    render_ml_insights(sales_df, customer_df)
     
     # Footer
     st.markdown("---")
@@ -0,0 +1,104 @@
+import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("streamlit")
+pytest.importorskip("snowflake.connector")
+pytest.importorskip("plotly")
+
+import streamlit_dashboard as dashboard
+
+
+class FakeCursor:
+    """Cursor that returns its result the way the Snowflake connector does: one pyarrow Table per chunk"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def execute(self, query, params=None):
+        return self
+
+    def fetch_arrow_batches(self):
+        return iter(self.chunks)
+
+    def fetch_arrow_all(self, force_return_table=False):
+        return pa.concat_tables(self.chunks) if self.chunks else None
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    account = "test_account"
+    database = "TEST_DB"
+    schema = "TEST_SCHEMA"
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def cursor(self):
+        return FakeCursor(self.chunks)
+
+
+def sales_chunk(order_ids):
+    n = len(order_ids)
+    return pa.table({
+        'ORDER_ID': order_ids,
+        'CUSTOMER_KEY': list(range(n)),
+        'ORDER_DATE': pa.array([datetime.date(2025, 1, 1)] * n, pa.date32()),
+        'QUANTITY_ORDERED': [1] * n,
+        'UNIT_PRICE': [10.0] * n,
+        'DISCOUNT_PERCENT': [0.0] * n,
+        'FINAL_LINE_AMOUNT': [10.0] * n,
+        'STORE_PROVINCE': ['Punjab'] * n,
+        'CUSTOMER_SEGMENT': ['VIP'] * n,
+        'PRODUCT_NAME': ['Product'] * n,
+    })
+
+
+def test_fetch_cached_table_concatenates_table_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(dashboard, "CACHE_DIR", str(tmp_path))
+    conn = FakeConnection([sales_chunk([1, 2]), sales_chunk([3])])
+
+    table = dashboard.fetch_cached_table(conn, "SELECT 1")
+
+    assert table.column('ORDER_ID').to_pylist() == [1, 2, 3]
+
+
+def test_load_sales_data_with_table_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(dashboard, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(dashboard, "get_worker_connection",
+                        lambda: FakeConnection([sales_chunk([1, 2]), sales_chunk([3])]))
+    dashboard.load_sales_data.clear()
+
+    df = dashboard.load_sales_data("All Time", (), ())
+
+    assert df is not None
+    assert df['ORDER_ID'].tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_top_product_pairs_counts_co_purchases(monkeypatch, use_scipy):
+    if use_scipy:
+        pytest.importorskip("scipy")
+    else:
+        monkeypatch.setattr(dashboard, "sp", None)
+    sales_df = dashboard.pd.DataFrame({
+        'ORDER_ID': [1, 1, 2, 2, 2, 3],
+        'PRODUCT_NAME': ['Tea', 'Milk', 'Milk', 'Tea', 'Sugar', 'Tea'],
+    })
+
+    pairs = dashboard.top_product_pairs(sales_df, 10)
+
+    assert pairs[0] == (('Milk', 'Tea'), 2)
+    assert sorted(pairs[1:]) == [(('Milk', 'Sugar'), 1), (('Sugar', 'Tea'), 1)]
+
+
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_top_product_pairs_with_no_sales(monkeypatch, use_scipy):
+    if not use_scipy:
+        monkeypatch.setattr(dashboard, "sp", None)
+    sales_df = dashboard.pd.DataFrame({'ORDER_ID': [], 'PRODUCT_NAME': []})
+
+    assert dashboard.top_product_pairs(sales_df, 10) == []